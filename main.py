@@ -3,28 +3,156 @@ VR Collaboration Spaces with 8 Languages + Web Interface + AI Features
 Supports: English, Turkish, Spanish, French, German, Italian, Chinese + Web Dashboard
 AI Features: Moderation, Note-Taking, Video Recording
 """
+# eventlet must patch the standard library before anything else imports it
+try:
+    import eventlet
+    import eventlet.wsgi
+    eventlet.monkey_patch()
+except ImportError:  # Without eventlet the web server runs on threads + Werkzeug
+    eventlet = None
 import asyncio
-import json
+import orjson
 import time
 import threading
 import os
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass, asdict, field, fields
+from contextlib import contextmanager
 from enum import Enum
+from functools import partial
+from types import MappingProxyType
+import math
 import re
-from collections import defaultdict
+import zlib
+import gzip
+import io
+from collections import defaultdict, deque
+from itertools import islice, product
 import socket
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; proximity checks fall back to NumPy
+    njit = prange = None
 import websockets
 import logging
-from flask import Flask, render_template_string, jsonify, request, send_file
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from flask import Flask, Response, jsonify, request, send_file, send_from_directory
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import webbrowser
 from threading import Timer
 
+logger = logging.getLogger("vrroom")
+
 # Ensure recordings directory exists
 os.makedirs("recordings", exist_ok=True)
 
+# Toxic keywords flagged by AI moderation, matched in a single pass
+TOXIC_RE = re.compile(r'\b(?:hate|stupid|idiot|shut\s*up|useless|dumb)\b', re.IGNORECASE)
+
+# Proximity chat range; also the cell size of the room's spatial hash grid
+PROXIMITY_CHAT_RADIUS = 3.0
+# Cell offsets covering every cell within one proximity radius
+_NEIGHBOR_CELLS = tuple(product((-1, 0, 1), repeat=3))
+
+# Position changes smaller than this (summed over axes) are not re-broadcast
+POSITION_EPSILON = 0.01
+
+# Rooms at least this large use the Numba proximity kernel when Numba is installed
+NUMBA_MIN_PARTICIPANTS = 32
+
+# Room state changes are broadcast at most once per this many seconds
+ROOM_UPDATE_DEBOUNCE = 0.25
+
+# Dashboard page and worker script, served from disk and cached by browsers for this many seconds
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+STATIC_MAX_AGE = 3600
+
+if njit is not None:
+    # The explicit signature compiles at import, so the first large room doesn't stall the event loop
+    @njit("boolean[::1](float32[:, ::1], int64, float64)", parallel=True, fastmath=True, cache=True)
+    def _nearby_mask_jit(positions, idx, r):
+        """Flag rows of positions within r of row idx, excluding idx itself"""
+        n = positions.shape[0]
+        out = np.zeros(n, dtype=np.bool_)
+        px, py, pz = positions[idx, 0], positions[idx, 1], positions[idx, 2]
+        r2 = r * r
+        for i in prange(n):
+            dx = positions[i, 0] - px
+            dy = positions[i, 1] - py
+            dz = positions[i, 2] - pz
+            out[i] = (dx * dx + dy * dy + dz * dz) < r2 and i != idx
+        return out
+else:
+    _nearby_mask_jit = None
+
+def _orjson_default(obj):
+    """Encode types orjson doesn't handle natively"""
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(obj, option: int = 0) -> bytes:
+    """Encode obj as UTF-8 JSON with orjson"""
+    return orjson.dumps(obj, default=_orjson_default, option=option | orjson.OPT_NON_STR_KEYS)
+
+def _diff_room_state(prev: Dict, curr: Dict) -> Dict:
+    """Build the room_patch that takes a client from room state prev to curr ({} if unchanged)"""
+    patch = {}
+    meta = {key: value for key, value in curr.items() if key != "participants" and prev.get(key) != value}
+    before = {p["user_id"]: p for p in prev["participants"]}
+    added, changed = [], {}
+    for p in curr["participants"]:
+        old = before.pop(p["user_id"], None)
+        if old is None:
+            added.append(p)
+            continue
+        fields = {key: value for key, value in p.items() if old.get(key) != value}
+        if fields:
+            changed[p["user_id"]] = fields
+    if meta:
+        patch["meta"] = meta
+    if added:
+        patch["added"] = added
+    if before:
+        patch["removed"] = list(before)
+    if changed:
+        patch["changed"] = changed
+    return patch
+
+# filename -> (mtime, gzip bytes); each asset is compressed once per version on disk
+_gzip_cache: Dict[str, Tuple[float, bytes]] = {}
+
+def _send_static(filename: str) -> Response:
+    """Serve a dashboard asset, pre-gzipped once for clients that accept it"""
+    if not request.accept_encodings["gzip"]:
+        response = send_from_directory(STATIC_DIR, filename, max_age=STATIC_MAX_AGE)
+    else:
+        path = os.path.join(STATIC_DIR, filename)
+        mtime = os.path.getmtime(path)
+        cached = _gzip_cache.get(filename)
+        if cached is None or cached[0] != mtime:
+            with open(path, "rb") as f:
+                cached = _gzip_cache[filename] = (mtime, gzip.compress(f.read(), 9))
+        response = send_file(io.BytesIO(cached[1]), download_name=filename, max_age=STATIC_MAX_AGE,
+                             etag=f"{mtime}-gzip", last_modified=mtime)
+        response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+class _OrjsonSocketIOJSON:
+    """json module shim so Socket.IO packets are encoded with orjson"""
+    @staticmethod
+    def dumps(obj, *args, **kwargs) -> str:
+        return _dumps(obj).decode('utf-8')
+
+    @staticmethod
+    def loads(s, *args, **kwargs):
+        return orjson.loads(s)
+
 class Language(Enum):
     ENGLISH = "en"
     TURKISH = "tr" 
@@ -34,6 +162,121 @@ class Language(Enum):
     ITALIAN = "it"
     CHINESE = "zh"
 
+FLAG_MAP = MappingProxyType({
+    Language.ENGLISH: "🇺🇸",
+    Language.TURKISH: "🇹🇷",
+    Language.SPANISH: "🇪🇸",
+    Language.FRENCH: "🇫🇷",
+    Language.GERMAN: "🇩🇪",
+    Language.ITALIAN: "🇮🇹",
+    Language.CHINESE: "🇨🇳"
+})
+LANG_NAME = MappingProxyType({
+    "en": "English", "tr": "Turkish", "es": "Spanish", "fr": "French",
+    "de": "German", "it": "Italian", "zh": "Chinese"
+})
+# Attach the flag and display name to each member so hot paths read them directly
+for _lang in Language:
+    _lang.flag = FLAG_MAP[_lang]
+    _lang.display_name = LANG_NAME[_lang.value]
+del _lang
+
+# Enhanced multilingual UI translations, shared read-only by all rooms
+VR_UI_TRANSLATIONS = MappingProxyType({
+    Language.ENGLISH: MappingProxyType({
+        "welcome": "Welcome to VR space",
+        "gesture_detected": "Gesture detected",
+        "user_nearby": "User nearby",
+        "mute_enabled": "Mute enabled",
+        "recording_started": "Recording started",
+        "user_joined": "joined the meeting",
+        "user_left": "left the meeting"
+    }),
+    Language.TURKISH: MappingProxyType({
+        "welcome": "VR alanına hoş geldiniz",
+        "gesture_detected": "Hareket algılandı", 
+        "user_nearby": "Yakında kullanıcı",
+        "mute_enabled": "Sessize alma etkinleştirildi",
+        "recording_started": "Kayıt başlatıldı",
+        "user_joined": "toplantıya katıldı",
+        "user_left": "toplantıdan ayrıldı"
+    }),
+    Language.SPANISH: MappingProxyType({
+        "welcome": "Bienvenido al espacio VR",
+        "gesture_detected": "Gesto detectado",
+        "user_nearby": "Usuario cercano",
+        "mute_enabled": "Silencio activado",
+        "recording_started": "Grabación iniciada",
+        "user_joined": "se unió a la reunión",
+        "user_left": "abandonó la reunión"
+    }),
+    Language.FRENCH: MappingProxyType({
+        "welcome": "Bienvenue dans l'espace VR",
+        "gesture_detected": "Geste détecté",
+        "user_nearby": "Utilisateur à proximité",
+        "mute_enabled": "Muet activé",
+        "recording_started": "Enregistrement démarré",
+        "user_joined": "a rejoint la réunion",
+        "user_left": "a quitté la réunion"
+    }),
+    Language.GERMAN: MappingProxyType({
+        "welcome": "Willkommen im VR-Raum",
+        "gesture_detected": "Geste erkannt",
+        "user_nearby": "Benutzer in der Nähe",
+        "mute_enabled": "Stumm aktiviert",
+        "recording_started": "Aufnahme gestartet",
+        "user_joined": "ist dem Meeting beigetreten",
+        "user_left": "hat das Meeting verlassen"
+    }),
+    Language.ITALIAN: MappingProxyType({
+        "welcome": "Benvenuto nello spazio VR",
+        "gesture_detected": "Gesto rilevato",
+        "user_nearby": "Utente vicino",
+        "mute_enabled": "Muto attivato",
+        "recording_started": "Registrazione iniziata",
+        "user_joined": "si è unito alla riunione",
+        "user_left": "ha lasciato la riunione"
+    }),
+    Language.CHINESE: MappingProxyType({
+        "welcome": "欢迎进入VR空间",
+        "gesture_detected": "检测到手势",
+        "user_nearby": "附近有用户",
+        "mute_enabled": "静音已启用",
+        "recording_started": "录制已开始",
+        "user_joined": "加入了会议",
+        "user_left": "离开了会议"
+    })
+})
+
+# Enhanced multilingual gesture reactions, keyed by gesture type then language code
+GESTURE_REACTIONS = MappingProxyType({
+    "wave": MappingProxyType({
+        "en": "waves hello", "tr": "el sallar", "es": "saluda", 
+        "fr": "salue", "de": "winkt", "it": "saluta", "zh": "挥手问好"
+    }),
+    "thumbs_up": MappingProxyType({
+        "en": "gives thumbs up", "tr": "beğenir", "es": "da me gusta", 
+        "fr": "fait un pouce", "de": "zeigt Daumen hoch", "it": "fa pollice su", "zh": "点赞"
+    }),
+    "clap": MappingProxyType({
+        "en": "claps", "tr": "alkışlar", "es": "aplaude", 
+        "fr": "applaudit", "de": "klatscht", "it": "applaude", "zh": "鼓掌"
+    }),
+    "point": MappingProxyType({
+        "en": "points", "tr": "işaret eder", "es": "señala", 
+        "fr": "pointe", "de": "zeigt", "it": "indica", "zh": "指向"
+    }),
+    "peace": MappingProxyType({
+        "en": "shows peace sign", "tr": "barış işareti yapar", "es": "muestra señal de paz",
+        "fr": "fait le signe de la paix", "de": "zeigt Peace-Zeichen", "it": "fa il segno della pace", "zh": "做和平手势"
+    })
+})
+# Flattened gesture reactions keyed by language code, then gesture type
+_GESTURE_REACTIONS_BY_LANG = MappingProxyType({
+    lang.value: MappingProxyType({gesture: reactions[lang.value] for gesture, reactions in GESTURE_REACTIONS.items()})
+    for lang in Language
+})
+
 class MessageType(Enum):
     CHAT = "chat"
     VOICE = "voice"
@@ -50,7 +293,7 @@ class ModerationAction(Enum):
     TIMEOUT = "timeout"
     REMOVE = "remove"
 
-@dataclass
+@dataclass(slots=True)
 class VRPosition:
     """3D position and rotation in VR space"""
     x: float
@@ -64,8 +307,12 @@ class VRPosition:
         """Calculate distance to another position"""
         return ((self.x - other.x)**2 + (self.y - other.y)**2 + (self.z - other.z)**2)**0.5
 
-@dataclass
-class Participant:
+class _ParticipantState:
+    """Derived and live-only participant state, kept out of the dataclass fields"""
+    __slots__ = ("ui_strings", "join_time_iso", "_speaking_handle", "_last_sent_pos")
+
+@dataclass(slots=True)
+class Participant(_ParticipantState):
     user_id: str
     name: str
     preferred_language: Language
@@ -75,26 +322,26 @@ class Participant:
     join_time: datetime = None
     avatar_id: str = "default"
     country_flag: str = "🌍"
-    recent_gestures: List['VRGesture'] = None
+    recent_gestures: Deque['VRGesture'] = None
 
     def __post_init__(self):
         if self.join_time is None:
             self.join_time = datetime.now()
+        self.join_time_iso = self.join_time.isoformat()
         if self.recent_gestures is None:
-            self.recent_gestures = []
+            self.recent_gestures = deque(maxlen=5)
+        # Resolve the UI translations once instead of on every event
+        self.ui_strings = VR_UI_TRANSLATIONS.get(self.preferred_language, VR_UI_TRANSLATIONS[Language.ENGLISH])
         # Set country flags based on language
-        flag_map = {
-            Language.ENGLISH: "🇺🇸",
-            Language.TURKISH: "🇹🇷", 
-            Language.SPANISH: "🇪🇸",
-            Language.FRENCH: "🇫🇷",
-            Language.GERMAN: "🇩🇪",
-            Language.ITALIAN: "🇮🇹",
-            Language.CHINESE: "🇨🇳"
-        }
-        self.country_flag = flag_map.get(self.preferred_language, "🌍")
+        self.country_flag = self.preferred_language.flag
+        self._speaking_handle = None
+        self._last_sent_pos = None
 
-@dataclass
+    def __reduce__(self):
+        """Copy and pickle the fields only; __post_init__ rebuilds derived state and live timers are dropped"""
+        return (self.__class__, tuple(getattr(self, f.name) for f in fields(self)))
+
+@dataclass(slots=True)
 class VRGesture:
     """Represents a VR hand gesture or body movement"""
     gesture_type: str
@@ -102,10 +349,12 @@ class VRGesture:
     intensity: float
     duration: float
     timestamp: datetime = None
+    timestamp_iso: str = field(init=False, repr=False)
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
+        self.timestamp_iso = self.timestamp.isoformat()
 
 class EnhancedMultilingualVRRoom:
     """VR Meeting Room with 8-language support, AI moderation, note-taking, and recording"""
@@ -113,126 +362,76 @@ class EnhancedMultilingualVRRoom:
         self.room_id = room_id
         self.room_name = room_name
         self.participants: Dict[str, Participant] = {}
-        self.messages: List = []
-        self.gestures: List[VRGesture] = []
+        # Positions stored as a contiguous (N, 3) array, row-aligned with _user_ids
+        self._positions = np.zeros((0, 3), dtype=np.float32)
+        self._user_ids: List[str] = []
+        self._user_index: Dict[str, int] = {}
+        # Spatial hash grid of user ids, keyed by PROXIMITY_CHAT_RADIUS-sized cells
+        self._grid: Dict[Tuple[int, int, int], Set[str]] = defaultdict(set)
+        self._grid_cell: Dict[str, Tuple[int, int, int]] = {}
+        # Bounded histories so long sessions don't grow without limit
+        self.messages: Deque = deque(maxlen=500)
+        self.gestures: Deque[VRGesture] = deque(maxlen=500)
         self.is_active = False
         self.start_time: Optional[datetime] = None
+        # Event loop running the room coroutines, captured in start_web_server
+        self._server_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._room_update_pending = False
+        # Last state sent to clients; room_patch diffs are taken against it
+        self._last_broadcast_state: Optional[Dict] = None
+        self._room_full_pending = False
+        # [event, data] pairs queued by an open cork() block
+        self._cork_buffer: Optional[List[list]] = None
+        # Latest unsent 'pos' row per user, flushed as one batched frame
+        self._pending_positions: Dict[str, list] = {}
+        # Snapshot of get_room_state_for_web, dropped whenever the room changes
+        self._room_state_cache: Optional[Dict] = None
+        self._room_state_json: Optional[bytes] = None
+        self._last_room_payload_gz: Optional[bytes] = None
         # === NEW: AI Features ===
         self.ai_moderation_enabled = True
         self.ai_note_taking_enabled = True
         self.video_recording_enabled = False
-        self.session_transcript = []  # Stores all events for notes
+        self.session_transcript: Deque[dict] = deque(maxlen=10_000)  # Stores recent events for notes
         self.moderation_log = []
         self.recording_start_time = None
+        # While recording, every transcript entry is also appended to this JSONL file
+        self._recording_file = None
+        self._recording_path: Optional[str] = None
+        self._recording_entries = 0
+        self._recording_lock = threading.Lock()
         self.project_context = "Global Localization Project Kickoff"
-        # Enhanced multilingual UI translations
-        self.vr_ui_translations = {
-            Language.ENGLISH: {
-                "welcome": "Welcome to VR space",
-                "gesture_detected": "Gesture detected",
-                "user_nearby": "User nearby",
-                "mute_enabled": "Mute enabled",
-                "recording_started": "Recording started",
-                "user_joined": "joined the meeting",
-                "user_left": "left the meeting"
-            },
-            Language.TURKISH: {
-                "welcome": "VR alanına hoş geldiniz",
-                "gesture_detected": "Hareket algılandı", 
-                "user_nearby": "Yakında kullanıcı",
-                "mute_enabled": "Sessize alma etkinleştirildi",
-                "recording_started": "Kayıt başlatıldı",
-                "user_joined": "toplantıya katıldı",
-                "user_left": "toplantıdan ayrıldı"
-            },
-            Language.SPANISH: {
-                "welcome": "Bienvenido al espacio VR",
-                "gesture_detected": "Gesto detectado",
-                "user_nearby": "Usuario cercano",
-                "mute_enabled": "Silencio activado",
-                "recording_started": "Grabación iniciada",
-                "user_joined": "se unió a la reunión",
-                "user_left": "abandonó la reunión"
-            },
-            Language.FRENCH: {
-                "welcome": "Bienvenue dans l'espace VR",
-                "gesture_detected": "Geste détecté",
-                "user_nearby": "Utilisateur à proximité",
-                "mute_enabled": "Muet activé",
-                "recording_started": "Enregistrement démarré",
-                "user_joined": "a rejoint la réunion",
-                "user_left": "a quitté la réunion"
-            },
-            Language.GERMAN: {
-                "welcome": "Willkommen im VR-Raum",
-                "gesture_detected": "Geste erkannt",
-                "user_nearby": "Benutzer in der Nähe",
-                "mute_enabled": "Stumm aktiviert",
-                "recording_started": "Aufnahme gestartet",
-                "user_joined": "ist dem Meeting beigetreten",
-                "user_left": "hat das Meeting verlassen"
-            },
-            Language.ITALIAN: {
-                "welcome": "Benvenuto nello spazio VR",
-                "gesture_detected": "Gesto rilevato",
-                "user_nearby": "Utente vicino",
-                "mute_enabled": "Muto attivato",
-                "recording_started": "Registrazione iniziata",
-                "user_joined": "si è unito alla riunione",
-                "user_left": "ha lasciato la riunione"
-            },
-            Language.CHINESE: {
-                "welcome": "欢迎进入VR空间",
-                "gesture_detected": "检测到手势",
-                "user_nearby": "附近有用户",
-                "mute_enabled": "静音已启用",
-                "recording_started": "录制已开始",
-                "user_joined": "加入了会议",
-                "user_left": "离开了会议"
-            }
-        }
-        # Enhanced multilingual gesture reactions
-        self.gesture_reactions = {
-            "wave": {
-                "en": "waves hello", "tr": "el sallar", "es": "saluda", 
-                "fr": "salue", "de": "winkt", "it": "saluta", "zh": "挥手问好"
-            },
-            "thumbs_up": {
-                "en": "gives thumbs up", "tr": "beğenir", "es": "da me gusta", 
-                "fr": "fait un pouce", "de": "zeigt Daumen hoch", "it": "fa pollice su", "zh": "点赞"
-            },
-            "clap": {
-                "en": "claps", "tr": "alkışlar", "es": "aplaude", 
-                "fr": "applaudit", "de": "klatscht", "it": "applaude", "zh": "鼓掌"
-            },
-            "point": {
-                "en": "points", "tr": "işaret eder", "es": "señala", 
-                "fr": "pointe", "de": "zeigt", "it": "indica", "zh": "指向"
-            },
-            "peace": {
-                "en": "shows peace sign", "tr": "barış işareti yapar", "es": "muestra señal de paz",
-                "fr": "fait le signe de la paix", "de": "zeigt Peace-Zeichen", "it": "fa il segno della pace", "zh": "做和平手势"
-            }
-        }
+        self.vr_ui_translations = VR_UI_TRANSLATIONS
+        self.gesture_reactions = GESTURE_REACTIONS
+        self._gesture_reactions_by_lang = _GESTURE_REACTIONS_BY_LANG
         # Room settings
         self.proximity_chat_enabled = True
         self.gesture_recognition = True
         self.spatial_audio = True
+        # Print the room layout after every join (VR_CONSOLE=1)
+        self.debug_console = os.getenv("VR_CONSOLE", "0") == "1"
         # Flask app for web interface
         self.app = Flask(__name__)
         self.app.config['SECRET_KEY'] = 'vr_collaboration_secret'
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        # room_full payloads are compressed once per change, so skip per-client HTTP compression
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", json=_OrjsonSocketIOJSON,
+                                 http_compression=False,
+                                 async_mode='eventlet' if eventlet is not None else 'threading')
         self.setup_web_routes()
 
     def setup_web_routes(self):
         """Setup Flask routes for web interface"""
         @self.app.route('/')
         def index():
-            return render_template_string(WEB_INTERFACE_HTML)
+            return _send_static('dashboard.html')
+
+        @self.app.route('/room-worker.js')
+        def room_worker():
+            return _send_static('room-worker.js')
 
         @self.app.route('/api/room_state')
         def get_room_state():
-            return jsonify(self.get_room_state_for_web())
+            return Response(self.get_room_state_json(), mimetype='application/json')
 
         @self.app.route('/api/ai_notes')
         def get_ai_notes():
@@ -244,31 +443,19 @@ class EnhancedMultilingualVRRoom:
 
         @self.app.route('/api/save_recording', methods=['POST'])
         def save_recording():
-            # Always save room metadata, even if transcript is empty
-            filename = f"recordings/recording_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            recording_data = {
-                "room_id": self.room_id,
-                "room_name": self.room_name,
-                "project_context": self.project_context,
-                "start_time": self.start_time.isoformat() if self.start_time else None,
-                "end_time": datetime.now().isoformat(),
-                "participants": [p.name for p in self.participants.values()],
-                "transcript": self.session_transcript or [{"timestamp": datetime.now().isoformat(), "type": "info", "data": {"message": "No events recorded yet"}}],
-                "moderation_log": self.moderation_log
-            }
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(recording_data, f, indent=2, ensure_ascii=False)
-            print(f"💾 Recording saved to {filename} with {len(self.session_transcript)} transcript entries")
+            filename = self.save_recording()
             return jsonify({"message": "Recording saved", "filename": filename})
 
         @self.socketio.on('connect')
         def handle_connect():
-            print(f"🌐 Web client connected")
-            emit('room_update', self.get_room_state_for_web())
+            logger.info("🌐 Web client connected")
+            join_room(self.room_id)
+            # Send what everyone else has, so the next room_patch applies cleanly
+            emit('room_full', self._last_broadcast_state or self.get_room_state_for_web())
 
         @self.socketio.on('disconnect')
         def handle_disconnect():
-            print(f"🌐 Web client disconnected")
+            logger.info("🌐 Web client disconnected")
 
         @self.socketio.on('perform_gesture')
         def handle_perform_gesture(data):
@@ -276,63 +463,119 @@ class EnhancedMultilingualVRRoom:
             gesture_type = data.get('gesture_type', 'wave')
             hand = data.get('hand', 'right')
             intensity = data.get('intensity', 1.0)
+            # Handlers run on Socket.IO threads; gestures belong on the room loop stored at startup
+            loop = self._server_loop
+            if loop is None or loop.is_closed():
+                logger.warning("⚠️ Ignoring gesture from %s: room loop is not running", user_id)
+                return
             asyncio.run_coroutine_threadsafe(
                 self.perform_gesture(user_id, gesture_type, hand, intensity),
-                asyncio.get_event_loop()
+                loop
             )
 
         @self.socketio.on('toggle_recording')
         def handle_toggle_recording():
-            self.video_recording_enabled = not self.video_recording_enabled
-            if self.video_recording_enabled:
-                self.recording_start_time = datetime.now()
-                if not self.session_transcript:  # Initialize transcript if empty
-                    self.session_transcript = [{"timestamp": datetime.now().isoformat(), "type": "info", "data": {"message": "Recording started"}}]
+            recording = not self.video_recording_enabled
+            now = datetime.now()
+            if recording:
+                self.start_recording(now)
                 msg = "📹 Video recording STARTED"
-                print(f"✅ {msg}")
-                self.socketio.emit('recording_update', {'is_recording': True, 'message': msg})
             else:
                 msg = "⏹️ Video recording STOPPED"
-                print(f"✅ {msg}")
-                self.socketio.emit('recording_update', {'is_recording': False, 'message': msg})
-            self.log_event_for_ai("recording_toggle", {"state": self.video_recording_enabled, "message": msg})
-            self.socketio.emit('room_update', self.get_room_state_for_web())
+            logger.info("✅ %s", msg)
+            self._broadcast('recording_update', {'is_recording': recording, 'message': msg})
+            self.log_event_for_ai("recording_toggle", {"state": recording, "message": msg}, ts=now)
+            if not recording:
+                self.stop_recording()  # after logging, so the stop event lands in the file
+            self._schedule_room_update()
 
         @self.socketio.on('request_ai_notes')
         def handle_request_ai_notes():
             notes = self.generate_ai_notes()
-            self.socketio.emit('ai_notes_response', notes)
+            self._broadcast('ai_notes_response', notes)
 
         @self.socketio.on('save_recording')
         def handle_save_recording():
-            # Save even if transcript is minimal
-            filename = f"recordings/recording_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            recording_data = {
-                "room_id": self.room_id,
-                "room_name": self.room_name,
-                "project_context": self.project_context,
-                "start_time": self.start_time.isoformat() if self.start_time else None,
-                "end_time": datetime.now().isoformat(),
-                "participants": [p.name for p in self.participants.values()],
-                "transcript": self.session_transcript or [{"timestamp": datetime.now().isoformat(), "type": "info", "data": {"message": "No events recorded yet"}}],
-                "moderation_log": self.moderation_log
-            }
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(recording_data, f, indent=2, ensure_ascii=False)
-            print(f"💾 Recording saved to {filename} with {len(self.session_transcript)} transcript entries")
-            self.socketio.emit('save_recording_response', {"message": "Recording saved", "filename": filename})
-
-    def log_event_for_ai(self, event_type: str, data: dict):
-        """Log events for AI note-taking and moderation"""
+            filename = self.save_recording()
+            self._broadcast('save_recording_response', {"message": "Recording saved", "filename": filename})
+
+    def start_recording(self, now: Optional[datetime] = None):
+        """Start streaming transcript entries to recordings/<room_id>_<ts>.jsonl"""
+        if self._recording_file is not None:
+            return
+        now = now or datetime.now()
+        path = f"recordings/{self.room_id}_{now.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        with self._recording_lock:
+            self._recording_file = open(path, 'ab', buffering=64 * 1024)
+            self._recording_path = path
+            self._recording_entries = 0
+        self.video_recording_enabled = True
+        self.recording_start_time = now
+        self._append_transcript({"timestamp": now.isoformat(), "type": "info", "data": {"message": "Recording started"}})
+
+    def stop_recording(self):
+        """Stop recording and close the JSONL file; its path is kept for the next save_recording"""
+        self.video_recording_enabled = False
+        with self._recording_lock:
+            if self._recording_file is not None:
+                self._recording_file.close()
+                self._recording_file = None
+        self._invalidate_room_state()
+
+    def _append_transcript(self, entry: dict):
+        """Add an entry to the in-memory transcript and, while recording, to the JSONL file"""
+        self.session_transcript.append(entry)
+        self._invalidate_room_state()
+        if self._recording_file is not None:
+            line = _dumps(entry) + b'\n'
+            with self._recording_lock:
+                if self._recording_file is not None:
+                    self._recording_file.write(line)
+                    self._recording_entries += 1
+
+    def save_recording(self) -> str:
+        """Save room metadata and moderation log, pointing at the streamed JSONL transcript"""
+        # Always save room metadata, even if nothing was recorded
+        now = datetime.now()
+        now_iso = now.isoformat()
+        filename = f"recordings/recording_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        with self._recording_lock:
+            if self._recording_file is not None:
+                self._recording_file.flush()
+            entries = self._recording_entries
+        recording_data = {
+            "room_id": self.room_id,
+            "room_name": self.room_name,
+            "project_context": self.project_context,
+            "start_time": self.start_time.isoformat() if self.start_time else None,
+            "end_time": now_iso,
+            "participants": [p.name for p in self.participants.values()],
+            "moderation_log": self.moderation_log
+        }
+        if self._recording_path:
+            recording_data["transcript_file"] = self._recording_path
+            recording_data["transcript_entries"] = entries
+        else:
+            # Never recorded: fall back to the recent in-memory events
+            entries = len(self.session_transcript)
+            recording_data["transcript"] = self.session_transcript or [{"timestamp": now_iso, "type": "info", "data": {"message": "No events recorded yet"}}]
+        with open(filename, 'wb') as f:
+            f.write(_dumps(recording_data, orjson.OPT_INDENT_2))
+        logger.info("💾 Recording saved to %s with %d transcript entries", filename, entries)
+        return filename
+
+    def log_event_for_ai(self, event_type: str, data: dict, ts: Optional[datetime] = None):
+        """Log events for AI note-taking and moderation, stamped with ts (default: now)"""
         if not (self.ai_note_taking_enabled or self.ai_moderation_enabled or self.video_recording_enabled):
             return
+        ts = ts or datetime.now()
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts.isoformat(),
             "type": event_type,
             "data": data
         }
-        self.session_transcript.append(entry)
-        print(f"📝 Logged event: {event_type} - {data}")
+        self._append_transcript(entry)
+        logger.debug("📝 Logged event: %s - %s", event_type, data)
         # Simple moderation check
         if self.ai_moderation_enabled:
             self._check_moderation(entry)
@@ -340,21 +583,20 @@ class EnhancedMultilingualVRRoom:
     def _check_moderation(self, entry):
         """Basic AI moderation logic"""
         if entry["type"] == "chat":
-            message = entry["data"].get("message", "").lower()
-            toxic_keywords = ["hate", "stupid", "idiot", "shut up", "useless", "dumb"]
-            if any(word in message for word in toxic_keywords):
+            message = entry["data"].get("message", "")
+            if TOXIC_RE.search(message):
                 user_id = entry["data"].get("user_id", "unknown")
                 action = ModerationAction.WARNING
                 log_entry = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": entry["timestamp"],
                     "user_id": user_id,
                     "message": message,
                     "action": action.value,
                     "reason": "Toxic language detected"
                 }
                 self.moderation_log.append(log_entry)
-                print(f"⚠️ Moderation Alert: {log_entry}")
-                self.socketio.emit('moderation_alert', log_entry)
+                logger.warning("⚠️ Moderation Alert: %s", log_entry)
+                self._emit('moderation_alert', log_entry)
 
     def generate_ai_notes(self) -> dict:
         """Generate professional AI-powered meeting notes"""
@@ -399,43 +641,55 @@ class EnhancedMultilingualVRRoom:
             avatar_id=f"avatar_{len(self.participants) + 1}"
         )
         self.participants[user_id] = participant
+        self._invalidate_room_state()
+        if user_id in self._user_index:
+            self._positions[self._user_index[user_id]] = (x, y, z)
+        else:
+            self._user_index[user_id] = len(self._user_ids)
+            self._user_ids.append(user_id)
+            self._positions = np.vstack([self._positions, np.array([[x, y, z]], dtype=np.float32)])
+        self._update_grid_cell(user_id, x, y, z)
         if not self.is_active:
             self.is_active = True
-            self.start_time = datetime.now()
+            self.start_time = participant.join_time
         # Log for AI
         self.log_event_for_ai("user_joined", {
             "user_id": user_id,
             "name": name,
             "language": preferred_language.value
-        })
+        }, ts=participant.join_time)
         # Send localized welcome message with fallback
-        welcome_key = "welcome"
-        welcome_msg = self.vr_ui_translations.get(preferred_language, 
-                                                 self.vr_ui_translations[Language.ENGLISH])[welcome_key]
-        joined_msg = self.vr_ui_translations.get(preferred_language,
-                                               self.vr_ui_translations[Language.ENGLISH])["user_joined"]
-        print(f"🥽 {participant.country_flag} {name} entered VR space at position ({x}, {y}, {z})")
-        print(f"   UI Language: {preferred_language.value} - '{welcome_msg}'")
-        print(f"   Status: {name} {joined_msg}")
-        # Update web interface
-        self.socketio.emit('room_update', self.get_room_state_for_web())
-        self.socketio.emit('user_joined', {
+        welcome_msg = participant.ui_strings["welcome"]
+        joined_msg = participant.ui_strings["user_joined"]
+        logger.info("🥽 %s %s entered VR space at position (%s, %s, %s)", participant.country_flag, name, x, y, z)
+        logger.info("   UI Language: %s - '%s'", preferred_language.value, welcome_msg)
+        logger.info("   Status: %s %s", name, joined_msg)
+        # Update web interface with a full resync
+        self._room_full_pending = True
+        self._schedule_room_update()
+        self._emit('user_joined', {
             'name': name, 
             'language': preferred_language.value,
             'flag': participant.country_flag,
             'message': f"{name} {joined_msg}"
         })
-        # Show updated room layout
-        self.render_room_console()
+        # Show updated room layout; printing happens off the event loop
+        if self.debug_console:
+            loop = self._server_loop or asyncio.get_running_loop()
+            loop.run_in_executor(None, print, self.format_room_console())
 
     async def update_participant_position(self, user_id: str, x: float, y: float, z: float,
                                         rotation_x: float = 0, rotation_y: float = 0, rotation_z: float = 0):
         """Update a participant's VR position and rotation"""
         if user_id not in self.participants:
             return False
-        old_pos = self.participants[user_id].vr_position
+        participant = self.participants[user_id]
+        old_pos = participant.vr_position
         new_pos = VRPosition(x, y, z, rotation_x, rotation_y, rotation_z)
-        self.participants[user_id].vr_position = new_pos
+        participant.vr_position = new_pos
+        self._positions[self._user_index[user_id]] = (x, y, z)
+        self._update_grid_cell(user_id, x, y, z)
+        self._invalidate_room_state()
         # Log position update
         self.log_event_for_ai("position_update", {
             "user_id": user_id,
@@ -444,37 +698,92 @@ class EnhancedMultilingualVRRoom:
         })
         # Check for proximity-based interactions
         await self._check_proximity_interactions(user_id, old_pos, new_pos)
-        # Update web interface
-        self.socketio.emit('position_update', {
-            'user_id': user_id,
-            'position': {'x': x, 'y': y, 'z': z},
-            'rotation': {'x': rotation_x, 'y': rotation_y, 'z': rotation_z}
-        })
+        # Update web interface with a compact row, skipping negligible moves
+        row = [user_id, x, y, z, rotation_x, rotation_y, rotation_z]
+        last = participant._last_sent_pos
+        if (last is None
+                or abs(x - last[1]) + abs(y - last[2]) + abs(z - last[3]) >= POSITION_EPSILON
+                or abs(rotation_x - last[4]) + abs(rotation_y - last[5]) + abs(rotation_z - last[6]) >= POSITION_EPSILON):
+            participant._last_sent_pos = row
+            first_pending = not self._pending_positions
+            self._pending_positions[user_id] = row
+            if first_pending:
+                self._call_later_threadsafe(0.05, self._flush_positions)
+        # 'pos' only reaches current clients; keep the snapshot sent to new ones at most one debounce behind
+        self._schedule_room_update()
         return True
 
+    def _nearby(self, user_id: str, radius: float):
+        """Return row indices and distances of the other participants within radius"""
+        idx = self._user_index[user_id]
+        positions = self._positions
+        if _nearby_mask_jit is not None and len(positions) >= NUMBA_MIN_PARTICIPANTS:
+            mask = _nearby_mask_jit(positions, idx, radius)
+        else:
+            deltas = positions - positions[idx]
+            # Compare squared distances; only hits need the square root
+            mask = np.einsum('ij,ij->i', deltas, deltas) < radius * radius
+            mask[idx] = False
+        hits = np.flatnonzero(mask)
+        return hits, np.linalg.norm(positions[hits] - positions[idx], axis=1)
+
+    def _update_grid_cell(self, user_id: str, x: float, y: float, z: float):
+        """Move a participant to the spatial grid cell containing (x, y, z)"""
+        cell = (math.floor(x / PROXIMITY_CHAT_RADIUS),
+                math.floor(y / PROXIMITY_CHAT_RADIUS),
+                math.floor(z / PROXIMITY_CHAT_RADIUS))
+        old_cell = self._grid_cell.get(user_id)
+        if old_cell == cell:
+            return
+        if old_cell is not None:
+            members = self._grid[old_cell]
+            members.discard(user_id)
+            if not members:
+                del self._grid[old_cell]
+        self._grid[cell].add(user_id)
+        self._grid_cell[user_id] = cell
+
     async def _check_proximity_interactions(self, user_id: str, old_pos: VRPosition, new_pos: VRPosition):
         """Check if user movement triggers proximity-based features"""
-        participant = self.participants[user_id]
-        for other_id, other_participant in self.participants.items():
-            if other_id == user_id:
-                continue
-            distance = new_pos.distance_to(other_participant.vr_position)
-            # Proximity chat threshold (within 3 units)
-            if distance < 3.0 and self.proximity_chat_enabled:
-                nearby_msg = self.vr_ui_translations.get(participant.preferred_language,
-                                                        self.vr_ui_translations[Language.ENGLISH])["user_nearby"]
-                print(f"👥 {participant.country_flag} {participant.name}: {nearby_msg} - {other_participant.country_flag} {other_participant.name}")
-                # Send to web interface
-                self.socketio.emit('proximity_alert', {
-                    'user1': participant.name,
-                    'user2': other_participant.name,
-                    'distance': round(distance, 2)
-                })
-                self.log_event_for_ai("proximity", {
-                    "user1": participant.name,
-                    "user2": other_participant.name,
-                    "distance": distance
-                })
+        if not self.proximity_chat_enabled:
+            return
+        participants = self.participants
+        participant = participants[user_id]
+        nearby_msg = participant.ui_strings["user_nearby"]
+        grid = self._grid
+        emit = self._emit
+        log = self.log_event_for_ai
+        px, py, pz = new_pos.x, new_pos.y, new_pos.z
+        radius_sq = PROXIMITY_CHAT_RADIUS * PROXIMITY_CHAT_RADIUS
+        # Only participants in the 27 surrounding grid cells can be within range
+        cx, cy, cz = self._grid_cell[user_id]
+        # Alerts for everyone now in range go out as one batch
+        with self.cork():
+            for dx, dy, dz in _NEIGHBOR_CELLS:
+                for other_id in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                    if other_id == user_id:
+                        continue
+                    other_participant = participants[other_id]
+                    other_pos = other_participant.vr_position
+                    ox, oy, oz = other_pos.x - px, other_pos.y - py, other_pos.z - pz
+                    distance_sq = ox * ox + oy * oy + oz * oz
+                    # Proximity chat threshold (within 3 units)
+                    if distance_sq >= radius_sq:
+                        continue
+                    distance = math.sqrt(distance_sq)
+                    logger.info("👥 %s %s: %s - %s %s", participant.country_flag, participant.name, nearby_msg,
+                                other_participant.country_flag, other_participant.name)
+                    # Send to web interface
+                    emit('proximity_alert', {
+                        'user1': participant.name,
+                        'user2': other_participant.name,
+                        'distance': round(distance, 2)
+                    })
+                    log("proximity", {
+                        "user1": participant.name,
+                        "user2": other_participant.name,
+                        "distance": distance
+                    })
 
     async def perform_gesture(self, user_id: str, gesture_type: str, hand: str = "right", intensity: float = 1.0):
         """Perform a VR gesture"""
@@ -483,62 +792,153 @@ class EnhancedMultilingualVRRoom:
         participant = self.participants[user_id]
         gesture = VRGesture(gesture_type, hand, intensity, duration=1.0)
         self.gestures.append(gesture)
-        participant.recent_gestures.append(gesture)
-        # Keep only the last 5 gestures per participant
-        participant.recent_gestures = participant.recent_gestures[-5:]
-        # Simulate speaking during gesture
-        participant.is_speaking = True
-        self.socketio.emit('speaking_update', {
-            'user_id': user_id,
-            'is_speaking': True
-        })
-        # Schedule to stop speaking after gesture duration
-        def stop_speaking():
-            participant.is_speaking = False
-            self.socketio.emit('speaking_update', {
+        participant.recent_gestures.append(gesture)  # Keeps only the last 5 gestures
+        self._invalidate_room_state()
+        # speaking_update and gesture_performed reach clients as one batch
+        with self.cork():
+            # Simulate speaking during gesture
+            if not participant.is_speaking:
+                participant.is_speaking = True
+                self._emit('speaking_update', {
+                    'user_id': user_id,
+                    'is_speaking': True
+                })
+            # Schedule to stop speaking after gesture duration, restarting it on repeated gestures
+            if participant._speaking_handle is not None:
+                participant._speaking_handle.cancel()
+            loop = self._server_loop or asyncio.get_running_loop()
+            participant._speaking_handle = loop.call_later(2.0, self._stop_speaking, user_id)
+            # Translate gesture feedback with fallback
+            gesture_msg = participant.ui_strings["gesture_detected"]
+            lang_code = participant.preferred_language.value
+            reaction = self._gesture_reactions_by_lang[lang_code].get(gesture_type, gesture_type)
+            logger.info("👋 %s %s %s (%s)", participant.country_flag, participant.name, reaction, gesture_msg)
+            # Log for AI
+            self.log_event_for_ai("gesture", {
+                "user_id": user_id,
+                "user": participant.name,
+                "gesture": gesture_type,
+                "reaction": reaction,
+                "language": lang_code
+            }, ts=gesture.timestamp)
+            # Send to web interface
+            self._emit('gesture_performed', {
                 'user_id': user_id,
-                'is_speaking': False
+                'user': participant.name,
+                'gesture': gesture_type,
+                'reaction': reaction,
+                'flag': participant.country_flag,
+                'language': lang_code,
+                'timestamp': gesture.timestamp_iso
             })
-            self.socketio.emit('room_update', self.get_room_state_for_web())
-        threading.Timer(2.0, stop_speaking).start()
-        # Translate gesture feedback with fallback
-        gesture_msg = self.vr_ui_translations.get(participant.preferred_language, 
-                                                 self.vr_ui_translations[Language.ENGLISH])["gesture_detected"]
-        lang_code = participant.preferred_language.value
-        reaction = self.gesture_reactions.get(gesture_type, {}).get(lang_code, gesture_type)
-        print(f"👋 {participant.country_flag} {participant.name} {reaction} ({gesture_msg})")
-        # Log for AI
-        self.log_event_for_ai("gesture", {
-            "user_id": user_id,
-            "user": participant.name,
-            "gesture": gesture_type,
-            "reaction": reaction,
-            "language": lang_code
-        })
-        # Send to web interface
-        self.socketio.emit('gesture_performed', {
-            'user_id': user_id,
-            'user': participant.name,
-            'gesture': gesture_type,
-            'reaction': reaction,
-            'flag': participant.country_flag,
-            'language': lang_code,
-            'timestamp': gesture.timestamp.isoformat()
-        })
         # Broadcast gesture to nearby participants
-        for other_id, other_participant in self.participants.items():
-            if other_id != user_id:
-                distance = participant.vr_position.distance_to(other_participant.vr_position)
-                if distance < 5.0:  # Gesture visible range
-                    print(f"   👀 {other_participant.country_flag} {other_participant.name} sees the gesture")
+        hits, _ = self._nearby(user_id, 5.0)  # Gesture visible range
+        for i in hits:
+            other_participant = self.participants[self._user_ids[i]]
+            logger.info("   👀 %s %s sees the gesture", other_participant.country_flag, other_participant.name)
         # Update room state for web interface
-        self.socketio.emit('room_update', self.get_room_state_for_web())
+        self._schedule_room_update()
         return True
 
+    def _stop_speaking(self, user_id: str):
+        """Clear the speaking state once a gesture's speaking window has elapsed"""
+        participant = self.participants.get(user_id)
+        if participant is None:
+            return
+        participant._speaking_handle = None
+        participant.is_speaking = False
+        self._invalidate_room_state()
+        self.socketio.emit('speaking_update', {
+            'user_id': user_id,
+            'is_speaking': False
+        })
+        self._schedule_room_update()
+
+    def _call_later_threadsafe(self, delay: float, callback):
+        """Run callback after delay on the room loop, or right away if there is no loop"""
+        loop = self._server_loop
+        if loop is None:
+            callback()
+        else:
+            # May be called from Socket.IO handler threads, so hop onto the loop first
+            loop.call_soon_threadsafe(loop.call_later, delay, callback)
+
+    def _broadcast(self, event: str, data, **kwargs):
+        """Emit a Socket.IO event from the room loop's thread, hopping onto it if needed"""
+        loop = self._server_loop
+        if loop is None or loop.is_closed():
+            self.socketio.emit(event, data, **kwargs)
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self.socketio.emit(event, data, **kwargs)
+        else:
+            loop.call_soon_threadsafe(partial(self.socketio.emit, event, data, **kwargs))
+
+    def _emit(self, event: str, data):
+        """Broadcast event to every client, or queue it while a cork() block is open"""
+        if self._cork_buffer is not None:
+            self._cork_buffer.append([event, data])
+        else:
+            self.socketio.emit(event, data)
+
+    @contextmanager
+    def cork(self):
+        """Send the broadcasts made through _emit inside the block as a single 'batch' event"""
+        if self._cork_buffer is not None:
+            # Nested block: the outermost one sends
+            yield
+            return
+        buffer = self._cork_buffer = []
+        try:
+            yield
+        finally:
+            self._cork_buffer = None
+            if len(buffer) == 1:
+                self.socketio.emit(*buffer[0])
+            elif buffer:
+                self.socketio.emit('batch', buffer)
+
+    def _schedule_room_update(self):
+        """Coalesce room broadcasts to at most one every ROOM_UPDATE_DEBOUNCE seconds"""
+        if self._room_update_pending:
+            return
+        self._room_update_pending = True
+        self._call_later_threadsafe(ROOM_UPDATE_DEBOUNCE, self._flush_room_update)
+
+    def _flush_room_update(self):
+        """Broadcast pending changes: the full state after a join, otherwise a room_patch diff"""
+        self._room_update_pending = False
+        state = self.get_room_state_for_web()
+        prev = self._last_broadcast_state
+        if prev is None or self._room_full_pending:
+            self._room_full_pending = False
+            self.socketio.emit('room_full', self.get_room_update_payload())
+        else:
+            patch = _diff_room_state(prev, state)
+            if not patch:
+                return
+            self.socketio.emit('room_patch', patch)
+        self._last_broadcast_state = state
+
+    def _flush_positions(self):
+        """Send every pending position row to the room's clients as one 'pos' frame"""
+        rows = list(self._pending_positions.values())
+        self._pending_positions.clear()
+        if rows:
+            self.socketio.emit('pos', rows, to=self.room_id)
+
     def render_room_console(self):
         """Render room layout in console"""
+        print(self.format_room_console())
+
+    def format_room_console(self) -> str:
+        """Format the room layout and participant legend for the console"""
         room_width, room_height = 20, 20
-        grid = [[' ' for _ in range(room_width)] for _ in range(room_height)]
+        grid = [[' '] * room_width for _ in range(room_height)]
         # Place participants on the grid
         for participant in self.participants.values():
             grid_x = max(0, min(room_width-1, int(participant.vr_position.x + room_width//2)))
@@ -547,23 +947,50 @@ class EnhancedMultilingualVRRoom:
             avatar = participant.name[0].upper()
             grid[grid_z][grid_x] = avatar
         # Convert grid to string
-        print("\nVR Room Top-Down View:")
-        print("+" + "-" * room_width + "+")
-        for row in grid:
-            print("|" + "".join(row) + "|")
-        print("+" + "-" * room_width + "+")
+        border = "+" + "-" * room_width + "+"
+        lines = ["\nVR Room Top-Down View:", border]
+        lines.extend("|" + "".join(row) + "|" for row in grid)
+        lines.append(border)
         # Add participant legend with flags
-        print("\nParticipants:")
+        lines.append("\nParticipants:")
         for participant in self.participants.values():
             pos = participant.vr_position
-            lang_name = {
-                "en": "English", "tr": "Turkish", "es": "Spanish", "fr": "French",
-                "de": "German", "it": "Italian", "zh": "Chinese"
-            }.get(participant.preferred_language.value, participant.preferred_language.value)
-            print(f"  {participant.name[0].upper()} = {participant.country_flag} {participant.name} ({lang_name}) at ({pos.x:.1f}, {pos.y:.1f}, {pos.z:.1f})")
+            lang_name = participant.preferred_language.display_name
+            lines.append(f"  {participant.name[0].upper()} = {participant.country_flag} {participant.name} ({lang_name}) at ({pos.x:.1f}, {pos.y:.1f}, {pos.z:.1f})")
+        return "\n".join(lines)
+
+    def _invalidate_room_state(self):
+        """Drop the cached room snapshot after a state change"""
+        self._room_state_cache = None
+        self._room_state_json = None
+        self._last_room_payload_gz = None
+
+    def get_room_state_json(self) -> bytes:
+        """Get the room state for the web interface as encoded JSON"""
+        if self._room_state_json is None:
+            self._room_state_json = _dumps(self.get_room_state_for_web())
+        return self._room_state_json
+
+    def get_room_update_payload(self):
+        """Get the room_full broadcast body, deflated once and shared by every client"""
+        payload = self.get_room_state_json()
+        if len(payload) < 200:
+            # Compression overhead outweighs the savings on tiny payloads
+            return self.get_room_state_for_web()
+        if self._last_room_payload_gz is None:
+            self._last_room_payload_gz = zlib.compress(payload)
+        return self._last_room_payload_gz
 
     def get_room_state_for_web(self) -> Dict:
         """Get room state formatted for web interface"""
+        if self._room_state_cache is None:
+            self._room_state_cache = self._build_room_state()
+        return self._room_state_cache
+
+    def _build_room_state(self) -> Dict:
+        """Build the room state snapshot cached by get_room_state_for_web"""
+        recent_gestures = list(islice(reversed(self.gestures), 10))
+        recent_gestures.reverse()
         return {
             "room_id": self.room_id,
             "room_name": self.room_name,
@@ -580,22 +1007,19 @@ class EnhancedMultilingualVRRoom:
                         "z": p.vr_position.z
                     },
                     "language": p.preferred_language.value,
-                    "language_name": {
-                        "en": "English", "tr": "Turkish", "es": "Spanish", "fr": "French",
-                        "de": "German", "it": "Italian", "zh": "Chinese"
-                    }.get(p.preferred_language.value),
+                    "language_name": p.preferred_language.display_name,
                     "flag": p.country_flag,
                     "avatar_id": p.avatar_id,
                     "is_speaking": p.is_speaking,
                     "is_muted": p.is_muted,
-                    "join_time": p.join_time.isoformat(),
+                    "join_time": p.join_time_iso,
                     "recent_gestures": [
                         {
                             "type": g.gesture_type,
                             "hand": g.hand,
                             "intensity": g.intensity,
-                            "timestamp": g.timestamp.isoformat()
-                        } for g in p.recent_gestures[-5:]
+                            "timestamp": g.timestamp_iso
+                        } for g in p.recent_gestures
                     ]
                 }
                 for p in self.participants.values()
@@ -605,9 +1029,9 @@ class EnhancedMultilingualVRRoom:
                     "type": g.gesture_type,
                     "hand": g.hand,
                     "intensity": g.intensity,
-                    "timestamp": g.timestamp.isoformat()
+                    "timestamp": g.timestamp_iso
                 }
-                for g in self.gestures[-10:]
+                for g in recent_gestures
             ],
             "languages_in_use": list(set(p.preferred_language.value for p in self.participants.values())),
             "start_time": self.start_time.isoformat() if self.start_time else None,
@@ -617,645 +1041,25 @@ class EnhancedMultilingualVRRoom:
 
     def start_web_server(self, port=5000):
         """Start the web server"""
+        try:
+            self._server_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._server_loop = None
         def run_server():
-            self.socketio.run(self.app, host='0.0.0.0', port=port, debug=False, allow_unsafe_werkzeug=True)
+            if eventlet is not None:
+                eventlet.wsgi.server(eventlet.listen(('0.0.0.0', port)), self.app, log_output=False)
+            else:
+                self.socketio.run(self.app, host='0.0.0.0', port=port, debug=False, allow_unsafe_werkzeug=True)
         web_thread = threading.Thread(target=run_server)
         web_thread.daemon = True
         web_thread.start()
-        print(f"🌐 Web interface started at http://localhost:{port}")
-        print(f"🎨 Open in browser to see real-time VR visualization")
+        logger.info("🌐 Web interface started at http://localhost:%s", port)
+        logger.info("🎨 Open in browser to see real-time VR visualization")
         # Auto-open browser after a short delay
         def open_browser():
             webbrowser.open(f'http://localhost:{port}')
         Timer(2.0, open_browser).start()
 
-# Web Interface HTML Template — ✅ WITH GESTURE CONTROLS + AI FEATURES + SAVE BUTTON
-WEB_INTERFACE_HTML = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>VR Collaboration Spaces - Live Dashboard</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.7.2/socket.io.js"></script>
-    <style>
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            color: white;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-            background: rgba(255, 255, 255, 0.1);
-            padding: 20px;
-            border-radius: 15px;
-            backdrop-filter: blur(10px);
-        }
-        .header h1 {
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }
-        .stats-bar {
-            display: flex;
-            justify-content: center;
-            gap: 30px;
-            margin-top: 15px;
-        }
-        .stat {
-            text-align: center;
-        }
-        .stat-number {
-            font-size: 2em;
-            font-weight: bold;
-            color: #ffd700;
-        }
-        .dashboard {
-            display: grid;
-            grid-template-columns: 1fr 400px;
-            gap: 20px;
-            margin-bottom: 30px;
-        }
-        .vr-room {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-            position: relative;
-            overflow: hidden;
-        }
-        .room-title {
-            font-size: 1.5em;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        .room-canvas {
-            width: 100%;
-            height: 400px;
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 10px;
-            position: relative;
-            overflow: hidden;
-            border: 2px solid rgba(255, 255, 255, 0.2);
-        }
-        .participant {
-            position: absolute;
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-weight: bold;
-            font-size: 1.2em;
-            transition: all 0.3s ease;
-            cursor: pointer;
-            box-shadow: 0 0 20px rgba(255, 255, 255, 0.3);
-        }
-        .participant:hover {
-            transform: scale(1.2);
-            box-shadow: 0 0 30px rgba(255, 255, 255, 0.5);
-        }
-        .participant.english { background: linear-gradient(45deg, #ff6b6b, #ee5a52); }
-        .participant.turkish { background: linear-gradient(45deg, #e74c3c, #c0392b); }
-        .participant.spanish { background: linear-gradient(45deg, #f39c12, #e67e22); }
-        .participant.french { background: linear-gradient(45deg, #3498db, #2980b9); }
-        .participant.german { background: linear-gradient(45deg, #2ecc71, #27ae60); }
-        .participant.italian { background: linear-gradient(45deg, #9b59b6, #8e44ad); }
-        .participant.chinese { background: linear-gradient(45deg, #1abc9c, #16a085); }
-        .gesture-effect {
-            box-shadow: 0 0 30px rgba(255, 215, 0, 0.8) !important;
-            transform: scale(1.3);
-            transition: all 0.5s ease;
-        }
-        .sidebar {
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }
-        .panel {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 20px;
-            backdrop-filter: blur(10px);
-        }
-        .panel h3 {
-            margin-bottom: 15px;
-            color: #ffd700;
-        }
-        .participant-list {
-            display: flex;
-            flex-direction: column;
-            gap: 10px;
-        }
-        .participant-item {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 10px;
-            border-radius: 8px;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }
-        .language-badge {
-            background: rgba(255, 215, 0, 0.2);
-            color: #ffd700;
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 0.8em;
-        }
-        .activity-feed {
-            max-height: 300px;
-            overflow-y: auto;
-        }
-        .activity-item {
-            background: rgba(255, 255, 255, 0.05);
-            padding: 8px;
-            margin-bottom: 5px;
-            border-radius: 5px;
-            font-size: 0.9em;
-        }
-        .gesture-item {
-            border-left: 3px solid #ffd700;
-            padding-left: 10px;
-        }
-        .languages-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(120px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }
-        .language-card {
-            background: rgba(255, 255, 255, 0.1);
-            padding: 15px;
-            border-radius: 10px;
-            text-align: center;
-            backdrop-filter: blur(5px);
-        }
-        .language-flag {
-            font-size: 2em;
-            margin-bottom: 5px;
-        }
-        .participant-popup {
-            position: absolute;
-            background: rgba(0, 0, 0, 0.9);
-            border-radius: 10px;
-            padding: 15px;
-            color: white;
-            max-width: 300px;
-            z-index: 1000;
-            box-shadow: 0 0 20px rgba(255, 255, 255, 0.3);
-            pointer-events: none;
-        }
-        .participant-popup h4 {
-            margin-bottom: 10px;
-            color: #ffd700;
-        }
-        .participant-popup ul {
-            list-style: none;
-            padding: 0;
-        }
-        .participant-popup li {
-            margin-bottom: 5px;
-            font-size: 0.9em;
-        }
-        @keyframes pulse {
-            0%, 100% { transform: scale(1); }
-            50% { transform: scale(1.05); }
-        }
-        .speaking {
-            animation: pulse 1s infinite;
-            box-shadow: 0 0 25px rgba(0, 255, 0, 0.5);
-        }
-        .connection-status {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            padding: 10px 15px;
-            border-radius: 20px;
-            font-size: 0.9em;
-        }
-        .connected {
-            background: rgba(0, 255, 0, 0.2);
-            border: 1px solid #00ff00;
-        }
-        .disconnected {
-            background: rgba(255, 0, 0, 0.2);
-            border: 1px solid #ff0000;
-        }
-        /* Gesture Controls Panel */
-        .gesture-controls {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-bottom: 15px;
-        }
-        .gesture-btn, .ai-btn {
-            background: #007bff;
-            color: white;
-            border: none;
-            padding: 10px 15px;
-            border-radius: 8px;
-            cursor: pointer;
-            font-weight: bold;
-            transition: all 0.2s ease;
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-        .gesture-btn:hover, .ai-btn:hover {
-            background: #0056b3;
-            transform: translateY(-2px);
-        }
-        .ai-btn.recording {
-            background: #e74c3c;
-        }
-        .ai-btn.recording:hover {
-            background: #c0392b;
-        }
-        .ai-notes-panel {
-            margin-top: 20px;
-            padding: 15px;
-            background: rgba(0, 0, 0, 0.2);
-            border-radius: 10px;
-            max-height: 250px;
-            overflow-y: auto;
-        }
-        .moderation-alert {
-            background: rgba(231, 76, 60, 0.3);
-            border-left: 3px solid #e74c3c;
-            padding: 8px;
-            margin: 5px 0;
-            border-radius: 5px;
-        }
-        .save-btn {
-            background: #28a745;
-            margin-top: 10px;
-        }
-        .save-btn:hover {
-            background: #218838;
-        }
-    </style>
-</head>
-<body>
-    <div class="connection-status" id="connectionStatus">🔴 Connecting...</div>
-    <div class="container">
-        <div class="header">
-            <h1>🥽 VR Collaboration Spaces</h1>
-            <p>Real-time Multilingual Virtual Meeting Environment with AI</p>
-            <div class="stats-bar">
-                <div class="stat">
-                    <div class="stat-number" id="participantCount">0</div>
-                    <div>Participants</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number" id="languageCount">0</div>
-                    <div>Languages</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number" id="gestureCount">0</div>
-                    <div>Gestures</div>
-                </div>
-                <div class="stat">
-                    <div class="stat-number" id="moderationCount">0</div>
-                    <div>Alerts</div>
-                </div>
-            </div>
-        </div>
-        <!-- 💥 NEW: AI Controls Panel -->
-        <div class="panel">
-            <h3>🤖 AI Assistant Controls</h3>
-            <div class="gesture-controls">
-                <button class="gesture-btn" data-gesture="wave">👋 Wave</button>
-                <button class="gesture-btn" data-gesture="thumbs_up">👍 Thumbs Up</button>
-                <button class="gesture-btn" data-gesture="clap">👏 Clap</button>
-                <button class="gesture-btn" data-gesture="point">👉 Point</button>
-                <button class="gesture-btn" data-gesture="peace">✌️ Peace</button>
-                <button class="ai-btn" id="recordBtn">📹 Start Recording</button>
-                <button class="ai-btn" id="notesBtn">📝 Get AI Notes</button>
-                <button class="ai-btn save-btn" id="saveBtn">💾 Save Recording</button>
-            </div>
-            <div class="ai-notes-panel" id="aiNotesPanel">
-                <p>AI notes will appear here...</p>
-            </div>
-        </div>
-        <div class="dashboard">
-            <div class="vr-room">
-                <h2 class="room-title" id="roomTitle">VR Meeting Room</h2>
-                <div class="room-canvas" id="roomCanvas">
-                    <!-- Participants will be positioned here -->
-                </div>
-            </div>
-            <div class="sidebar">
-                <div class="panel">
-                    <h3>👥 Participants</h3>
-                    <div class="participant-list" id="participantList">
-                        <!-- Participant list will be populated here -->
-                    </div>
-                </div>
-                <div class="panel">
-                    <h3>🎭 Recent Activity</h3>
-                    <div class="activity-feed" id="activityFeed">
-                        <!-- Activity feed will be populated here -->
-                    </div>
-                </div>
-            </div>
-        </div>
-        <div class="panel">
-            <h3>🌍 Languages in Session</h3>
-            <div class="languages-grid" id="languagesGrid">
-                <!-- Language cards will be populated here -->
-            </div>
-        </div>
-    </div>
-    <script>
-        const socket = io();
-        let roomState = {};
-        let selectedUserId = null;
-        function updateParticipantInState(userId, updates) {
-            if (!roomState.participants) return;
-            const index = roomState.participants.findIndex(p => p.user_id === userId);
-            if (index !== -1) {
-                roomState.participants[index] = { ...roomState.participants[index], ...updates };
-            }
-        }
-        const statusEl = document.getElementById('connectionStatus');
-        socket.on('connect', function() {
-            statusEl.textContent = '🟢 Connected';
-            statusEl.className = 'connection-status connected';
-        });
-        socket.on('disconnect', function() {
-            statusEl.textContent = '🔴 Disconnected';
-            statusEl.className = 'connection-status disconnected';
-        });
-        socket.on('room_update', function(data) {
-            roomState = data;
-            updateDashboard();
-        });
-        socket.on('user_joined', function(data) {
-            addActivityItem(`${data.flag} ${data.name} joined (${data.language.toUpperCase()})`, 'join');
-        });
-        socket.on('gesture_performed', function(data) {
-            addActivityItem(`${data.flag} ${data.user} ${data.reaction}`, 'gesture');
-            const existing = roomState.participants?.find(p => p.user_id === data.user_id);
-            if (existing) {
-                const newGesture = {
-                    type: data.gesture,
-                    hand: data.hand || 'right',
-                    intensity: 1.0,
-                    timestamp: data.timestamp
-                };
-                const updatedGestures = [...(existing.recent_gestures || []), newGesture].slice(-5);
-                updateParticipantInState(data.user_id, { recent_gestures: updatedGestures });
-            }
-            const participantEl = Array.from(document.getElementsByClassName('participant')).find(
-                el => el.dataset.userId === data.user_id
-            );
-            if (participantEl) {
-                participantEl.classList.add('gesture-effect');
-                setTimeout(() => participantEl.classList.remove('gesture-effect'), 2000);
-            }
-        });
-        socket.on('speaking_update', function(data) {
-            updateParticipantInState(data.user_id, { is_speaking: data.is_speaking });
-            const participantEl = Array.from(document.getElementsByClassName('participant')).find(
-                el => el.dataset.userId === data.user_id
-            );
-            if (participantEl) {
-                if (data.is_speaking) {
-                    participantEl.classList.add('speaking');
-                } else {
-                    participantEl.classList.remove('speaking');
-                }
-            }
-            updateParticipantList();
-        });
-        socket.on('proximity_alert', function(data) {
-            addActivityItem(`👥 ${data.user1} and ${data.user2} are nearby (${data.distance}m)`, 'proximity');
-        });
-        socket.on('recording_update', function(data) {
-            addActivityItem(data.message, 'recording');
-            const recordBtn = document.getElementById('recordBtn');
-            if (data.is_recording) {
-                recordBtn.textContent = '⏹️ Stop Recording';
-                recordBtn.classList.add('recording');
-            } else {
-                recordBtn.textContent = '📹 Start Recording';
-                recordBtn.classList.remove('recording');
-            }
-        });
-        socket.on('moderation_alert', function(data) {
-            addActivityItem(`⚠️ MODERATION: ${data.user_id} - ${data.reason}`, 'moderation');
-            const feed = document.getElementById('activityFeed');
-            const alertEl = document.createElement('div');
-            alertEl.className = 'moderation-alert';
-            alertEl.innerHTML = `<strong>🚨 AI Moderation Alert</strong><br>User: ${data.user_id}<br>Reason: ${data.reason}`;
-            feed.insertBefore(alertEl, feed.firstChild);
-        });
-        socket.on('ai_notes_response', function(notes) {
-            const panel = document.getElementById('aiNotesPanel');
-            let html = `<h4>📋 Project Sync Summary: Global Localization Project Kickoff</h4>`;
-            html += `<p><strong>Summary:</strong> ${notes.summary}</p>`;
-            if (notes.action_items && notes.action_items.length > 0) {
-                html += `<p><strong>Action Items:</strong></p><ul>`;
-                notes.action_items.forEach(item => html += `<li>${item}</li>`);
-                html += `</ul>`;
-            }
-            if (notes.key_moments && notes.key_moments.length > 0) {
-                html += `<p><strong>Key Moments:</strong></p><ul>`;
-                notes.key_moments.forEach(moment => html += `<li>${moment}</li>`);
-                html += `</ul>`;
-            }
-            panel.innerHTML = html;
-        });
-        socket.on('save_recording_response', function(data) {
-            if (data.error) {
-                alert("❌ " + data.error);
-            } else {
-                addActivityItem("✅ Recording saved: " + data.filename, 'recording');
-                alert("✅ Recording saved to: " + data.filename);
-            }
-        });
-        function updateDashboard() {
-            document.getElementById('participantCount').textContent = roomState.participant_count || 0;
-            document.getElementById('languageCount').textContent = roomState.languages_in_use?.length || 0;
-            document.getElementById('gestureCount').textContent = roomState.recent_gestures?.length || 0;
-            document.getElementById('moderationCount').textContent = roomState.moderation_count || 0;
-            document.getElementById('roomTitle').textContent = roomState.room_name || 'VR Meeting Room';
-            updateRoomCanvas();
-            updateParticipantList();
-            updateLanguagesGrid();
-        }
-        function updateRoomCanvas() {
-            const canvas = document.getElementById('roomCanvas');
-            canvas.innerHTML = '';
-            if (!roomState.participants) return;
-            const canvasWidth = canvas.clientWidth;
-            const canvasHeight = canvas.clientHeight;
-            const roomSize = 20;
-            roomState.participants.forEach(participant => {
-                const participantEl = document.createElement('div');
-                participantEl.className = `participant ${participant.language} ${participant.is_speaking ? 'speaking' : ''}`;
-                participantEl.textContent = participant.name.charAt(0).toUpperCase();
-                participantEl.dataset.userId = participant.user_id;
-                participantEl.title = `${participant.flag} ${participant.name} (${participant.language_name})`;
-                const x = ((participant.position.x + roomSize/2) / roomSize) * canvasWidth;
-                const z = ((participant.position.z + roomSize/2) / roomSize) * canvasHeight;
-                participantEl.style.left = `${Math.max(0, Math.min(canvasWidth - 40, x - 20))}px`;
-                participantEl.style.top = `${Math.max(0, Math.min(canvasHeight - 40, z - 20))}px`;
-                participantEl.addEventListener('click', () => {
-                    showParticipantDetails(participant);
-                    selectedUserId = participant.user_id;
-                });
-                canvas.appendChild(participantEl);
-            });
-        }
-        function showParticipantDetails(participant) {
-            const existingPopups = document.getElementsByClassName('participant-popup');
-            while (existingPopups.length > 0) {
-                existingPopups[0].remove();
-            }
-            const popup = document.createElement('div');
-            popup.className = 'participant-popup';
-            const status = participant.is_speaking ? '🎤 Speaking' : (participant.is_muted ? '🔇 Muted' : '🔊 Not speaking');
-            let gesturesHtml = '<p>No recent gestures</p>';
-            if (participant.recent_gestures && participant.recent_gestures.length > 0) {
-                gesturesHtml = '<ul>' + participant.recent_gestures.map(g => 
-                    `<li>${g.type} (${g.hand}, ${new Date(g.timestamp).toLocaleTimeString()})</li>`
-                ).join('') + '</ul>';
-            }
-            popup.innerHTML = `
-                <h4>${participant.flag} ${participant.name}</h4>
-                <p>Language: ${participant.language_name}</p>
-                <p>Status: ${status}</p>
-                <p>Recent Gestures:</p>
-                ${gesturesHtml}
-            `;
-            const participantEl = Array.from(document.getElementsByClassName('participant')).find(
-                el => el.dataset.userId === participant.user_id
-            );
-            if (participantEl) {
-                const rect = participantEl.getBoundingClientRect();
-                popup.style.left = `${rect.right + 10}px`;
-                popup.style.top = `${rect.top}px`;
-            }
-            document.body.appendChild(popup);
-            setTimeout(() => popup.remove(), 5000);
-            const clickHandler = (e) => {
-                if (!popup.contains(e.target) && (!participantEl || !participantEl.contains(e.target))) {
-                    popup.remove();
-                    document.removeEventListener('click', clickHandler);
-                }
-            };
-            document.addEventListener('click', clickHandler);
-        }
-        function updateParticipantList() {
-            const list = document.getElementById('participantList');
-            list.innerHTML = '';
-            if (!roomState.participants) return;
-            roomState.participants.forEach(participant => {
-                const item = document.createElement('div');
-                item.className = 'participant-item';
-                const statusIcon = participant.is_speaking ? '🎤' : (participant.is_muted ? '🔇' : '🔊');
-                item.innerHTML = `
-                    <span style="font-size: 1.2em">${participant.flag}</span>
-                    <span>${participant.name}</span>
-                    <span class="language-badge">${participant.language_name}</span>
-                    <span>${statusIcon}</span>
-                `;
-                list.appendChild(item);
-            });
-        }
-        function updateLanguagesGrid() {
-            const grid = document.getElementById('languagesGrid');
-            grid.innerHTML = '';
-            const languageInfo = {
-                'en': { name: 'English', flag: '🇺🇸' },
-                'tr': { name: 'Turkish', flag: '🇹🇷' },
-                'es': { name: 'Spanish', flag: '🇪🇸' },
-                'fr': { name: 'French', flag: '🇫🇷' },
-                'de': { name: 'German', flag: '🇩🇪' },
-                'it': { name: 'Italian', flag: '🇮🇹' },
-                'zh': { name: 'Chinese', flag: '🇨🇳' }
-            };
-            if (roomState.languages_in_use) {
-                roomState.languages_in_use.forEach(lang => {
-                    const info = languageInfo[lang];
-                    if (info) {
-                        const card = document.createElement('div');
-                        card.className = 'language-card';
-                        card.innerHTML = `
-                            <div class="language-flag">${info.flag}</div>
-                            <div>${info.name}</div>
-                        `;
-                        grid.appendChild(card);
-                    }
-                });
-            }
-        }
-        function addActivityItem(message, type) {
-            const feed = document.getElementById('activityFeed');
-            const item = document.createElement('div');
-            item.className = `activity-item ${type === 'gesture' ? 'gesture-item' : ''} ${type === 'moderation' ? 'moderation-alert' : ''}`;
-            const timestamp = new Date().toLocaleTimeString();
-            item.innerHTML = `<strong>${timestamp}</strong> - ${message}`;
-            feed.insertBefore(item, feed.firstChild);
-            while (feed.children.length > 20) {
-                feed.removeChild(feed.lastChild);
-            }
-        }
-        // Gesture Controls
-        document.querySelectorAll('.gesture-btn:not(#recordBtn):not(#notesBtn):not(#saveBtn)').forEach(btn => {
-            btn.addEventListener('click', function() {
-                const gestureType = this.getAttribute('data-gesture');
-                const targetUserId = selectedUserId || (roomState.participants?.[0]?.user_id);
-                if (!targetUserId) {
-                    alert("No participants available.");
-                    return;
-                }
-                socket.emit('perform_gesture', {
-                    user_id: targetUserId,
-                    gesture_type: gestureType,
-                    hand: "right",
-                    intensity: 1.0
-                });
-                addActivityItem(`You performed '${gestureType}' on ${targetUserId}`, 'gesture');
-            });
-        });
-        // AI Controls
-        document.getElementById('recordBtn').addEventListener('click', () => {
-            socket.emit('toggle_recording');
-        });
-        document.getElementById('notesBtn').addEventListener('click', () => {
-            socket.emit('request_ai_notes');
-        });
-        document.getElementById('saveBtn').addEventListener('click', () => {
-            socket.emit('save_recording');
-        });
-        // Initial load
-        setTimeout(() => {
-            fetch('/api/room_state')
-                .then(response => response.json())
-                .then(data => {
-                    roomState = data;
-                    updateDashboard();
-                });
-        }, 500);
-    </script>
-</body>
-</html>
-'''
-
 async def demo_multilingual_vr_with_web():
     """Demo the enhanced multilingual VR system with web interface (50-minute version)"""
     print("🌍 Enhanced Multilingual VR Collaboration Spaces")
@@ -1281,9 +1085,7 @@ async def demo_multilingual_vr_with_web():
     ]
     
     # Start recording before adding participants
-    vr_room.video_recording_enabled = True
-    vr_room.recording_start_time = datetime.now()
-    vr_room.session_transcript = [{"timestamp": datetime.now().isoformat(), "type": "info", "data": {"message": "Recording started"}}]
+    vr_room.start_recording()
     print("✅ 📹 Video recording STARTED automatically to capture all events")
 
     for user_id, name, lang, x, y, z in participants_data:
@@ -1315,20 +1117,7 @@ async def demo_multilingual_vr_with_web():
 
     # Simulate saving the recording
     print("\n💾 Attempting to save recording...")
-    filename = f"recordings/recording_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    recording_data = {
-        "room_id": vr_room.room_id,
-        "room_name": vr_room.room_name,
-        "project_context": vr_room.project_context,
-        "start_time": vr_room.start_time.isoformat() if vr_room.start_time else None,
-        "end_time": datetime.now().isoformat(),
-        "participants": [p.name for p in vr_room.participants.values()],
-        "transcript": vr_room.session_transcript,
-        "moderation_log": vr_room.moderation_log
-    }
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(recording_data, f, indent=2, ensure_ascii=False)
-    print(f"✅ Recording saved to {filename} with {len(vr_room.session_transcript)} transcript entries")
+    filename = vr_room.save_recording()
     vr_room.socketio.emit('save_recording_response', {"message": "Recording saved", "filename": filename})
 
     print("\n🌐 Web Interface Features:")
@@ -1355,6 +1144,18 @@ async def demo_multilingual_vr_with_web():
     # Run for 50 minutes (3000 seconds)
     await asyncio.sleep(3000)
 
+def configure_logging() -> QueueListener:
+    """Route room logs to stdout through a background QueueListener (level from VR_LOG_LEVEL)"""
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(os.getenv("VR_LOG_LEVEL", "INFO").upper())
+    logger.propagate = False
+    listener.start()
+    return listener
+
 def create_enhanced_requirements():
     """Create enhanced requirements file"""
     enhanced_requirements = """
@@ -1374,6 +1175,11 @@ asyncio-mqtt>=0.13.0
 # Utilities
 requests>=2.31.0
 numpy>=1.24.0
+orjson>=3.8.0
+# Optional: JIT proximity checks for very large rooms
+# numba>=0.57.0
+# Optional: greenlet web server for many concurrent dashboard clients
+# eventlet>=0.33.0
 """
     with open("requirements_enhanced.txt", "w") as f:
         f.write(enhanced_requirements)
@@ -1385,8 +1191,11 @@ if __name__ == "__main__":
     print("=" * 50)
     # Create requirements file
     create_enhanced_requirements()
+    log_listener = configure_logging()
     # Run the demo
     try:
         asyncio.run(demo_multilingual_vr_with_web())
     except KeyboardInterrupt:
-        print("\n👋 Demo stopped by user")
\ No newline at end of file
+        print("\n👋 Demo stopped by user")
+    finally:
+        log_listener.stop()
\ No newline at end of file
@@ -0,0 +1,84 @@
+// Which dashboard parts depend on each top-level room state field
+const META_PARTS = {
+    room_name: ['stats'],
+    participant_count: ['stats'],
+    recent_gestures: ['stats'],
+    moderation_count: ['stats'],
+    languages_in_use: ['stats', 'languages']
+};
+const metaJson = {};
+let participants = new Map();      // user_id -> participant, in room order
+let participantJson = new Map();   // user_id -> JSON of that participant
+let order = [];
+async function decode(data) {
+    // Large payloads arrive as a zlib-deflated JSON ArrayBuffer, small ones already decoded
+    if (data instanceof ArrayBuffer) {
+        const stream = new Blob([data]).stream().pipeThrough(new DecompressionStream('deflate'));
+        return JSON.parse(await new Response(stream).text());
+    }
+    return data;
+}
+function newPatch() {
+    return { meta: {}, upserts: [], order: null, parts: new Set() };
+}
+function setMeta(patch, key, value) {
+    const json = JSON.stringify(value);
+    if (metaJson[key] !== json) {
+        metaJson[key] = json;
+        patch.meta[key] = value;
+        (META_PARTS[key] || []).forEach(part => patch.parts.add(part));
+    }
+}
+function setParticipant(patch, next, p) {
+    const json = JSON.stringify(p);
+    if (participantJson.get(p.user_id) !== json) patch.upserts.push(p);
+    next.set(p.user_id, p);
+    participantJson.set(p.user_id, json);
+}
+function finish(patch) {
+    const ids = [...participants.keys()];
+    const reordered = ids.length !== order.length || ids.some((userId, i) => userId !== order[i]);
+    if (reordered || patch.upserts.length) {
+        patch.order = order = ids;
+        patch.parts.add('canvas');
+        patch.parts.add('list');
+    }
+    patch.parts = [...patch.parts];
+    if (patch.parts.length || Object.keys(patch.meta).length) self.postMessage(patch);
+}
+function applyFull(state) {
+    const patch = newPatch();
+    for (const [key, value] of Object.entries(state)) {
+        if (key !== 'participants') setMeta(patch, key, value);
+    }
+    const next = new Map();
+    (state.participants || []).forEach(p => setParticipant(patch, next, p));
+    participantJson.forEach((_, userId) => { if (!next.has(userId)) participantJson.delete(userId); });
+    participants = next;
+    finish(patch);
+}
+function applyRoomPatch(roomPatch) {
+    const patch = newPatch();
+    Object.entries(roomPatch.meta || {}).forEach(([key, value]) => setMeta(patch, key, value));
+    (roomPatch.removed || []).forEach(userId => {
+        participants.delete(userId);
+        participantJson.delete(userId);
+    });
+    Object.entries(roomPatch.changed || {}).forEach(([userId, fields]) => {
+        const before = participants.get(userId);
+        if (before) setParticipant(patch, participants, { ...before, ...fields });
+    });
+    (roomPatch.added || []).forEach(p => setParticipant(patch, participants, p));
+    finish(patch);
+}
+// Messages are handled strictly in order, so a patch never lands before the full state it follows
+let pending = Promise.resolve();
+self.onmessage = function({ data: message }) {
+    pending = pending.then(async () => {
+        if (message.kind === 'full') {
+            applyFull(await decode(message.data));
+        } else {
+            applyRoomPatch(message.data);
+        }
+    }).catch(err => console.error('room worker:', err));
+};